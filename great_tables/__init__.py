@@ -13,6 +13,7 @@ from . import loc
 from . import style
 from ._styles import FromColumn as from_column
 from ._helpers import letters, LETTERS, px, pct, md, html, random_id, system_fonts, nanoplot_options
+from ._export import configure_browser_pool, save_all
 
 
 __all__ = (
@@ -28,6 +29,8 @@ __all__ = (
     "nanoplot_options",
     "random_id",
     "from_column",
+    "configure_browser_pool",
+    "save_all",
     "vals",
     "loc",
     "style",
@@ -1,7 +1,18 @@
 from __future__ import annotations
 
+import atexit
+import base64
+import math
+import queue
+import shutil
 import tempfile
-from typing import TYPE_CHECKING, Literal
+import threading
+from collections.abc import Generator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
 
 from typing_extensions import TypeAlias
 
@@ -33,6 +44,21 @@ def as_raw_html(
     str
         An HTML fragment containing a table.
     """
+    # Tables with a fixed ID render to the same HTML every time, so that HTML is kept on the GT
+    # object for reuse (e.g., by `save()` followed by `as_raw_html()`); tables without an ID get a
+    # new random ID on every render and so are always rendered anew. The cache can't go stale:
+    # `_replace()` drops it from modified copies and the table data is a copy of the caller's
+    # DataFrame (see `GTData.from_data()`)
+    cache_key = (make_page, all_important)
+
+    html_cache: dict[tuple[bool, bool], str] | None = None
+
+    if self._options.table_id.value is not None:
+        html_cache = self.__dict__.setdefault("_html_cache", {})
+
+    if html_cache is not None and cache_key in html_cache:
+        return html_cache[cache_key]
+
     built_table = self._build_data(context="html")
 
     html_table = built_table._render_as_html(
@@ -40,6 +66,9 @@ def as_raw_html(
         all_important=all_important,
     )
 
+    if html_cache is not None:
+        html_cache[cache_key] = html_table
+
     return html_table
 
 
@@ -51,6 +80,468 @@ WebDrivers: TypeAlias = Literal[
     "edge",
 ]
 
+# Webdrivers for Chromium-based browsers, which accept Chrome DevTools Protocol (CDP) commands
+_CDP_WEB_DRIVERS = ("chrome", "edge")
+
+
+def _launch_driver(web_driver: WebDrivers, window_size: tuple[int, int], scale: float) -> Any:
+    from selenium import webdriver
+
+    # Set the webdriver and options based on the chosen browser (`web_driver=` argument)
+    if web_driver == "chrome":
+        wdriver = webdriver.Chrome
+        wd_options = webdriver.ChromeOptions()
+    elif web_driver == "safari":
+        wdriver = webdriver.Safari
+        wd_options = webdriver.SafariOptions()
+    elif web_driver == "firefox":
+        wdriver = webdriver.Firefox
+        wd_options = webdriver.FirefoxOptions()
+    elif web_driver == "edge":
+        wdriver = webdriver.Edge
+        wd_options = webdriver.EdgeOptions()
+    else:
+        raise ValueError(f"The supplied `web_driver=` value (`{web_driver}`) is not supported.")
+
+    # All webdrivers except for 'Firefox' can operate in headless mode; they all accept window size
+    # options are separate width and height arguments
+    if web_driver != "firefox":
+        wd_options.add_argument(str("--headless"))
+
+    wd_options.add_argument(f"--width={window_size[0]}")
+    wd_options.add_argument(f"--height={window_size[1]}")
+
+    # Chromium-based browsers render the page at the requested scale (so that one CSS pixel maps
+    # to `scale` pixels in screenshots); other browsers are scaled by zooming the page instead
+    if web_driver in _CDP_WEB_DRIVERS:
+        wd_options.add_argument(f"--force-device-scale-factor={scale}")
+
+    driver: Any = wdriver(options=wd_options)
+
+    # Not every browser picks up the window size from the launch arguments, so set it explicitly
+    driver.set_window_size(*window_size)
+
+    return driver
+
+
+class _BrowserPool:
+    """
+    A pool of headless browsers that can be reused across calls to `save()`.
+
+    Drivers are keyed by the launch settings (`web_driver`, `window_size`, `scale`). With a `size`
+    of `0` (the default) no drivers are kept around, so every `save()` launches and quits its own
+    browser. Otherwise, up to `size` idle drivers per key are retained and are recycled after
+    `max_uses` captures or whenever they raise a `WebDriverException`.
+    """
+
+    def __init__(self, size: int = 0, max_uses: int = 50):
+        self.size = size
+        self.max_uses = max_uses
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[Any, ...], queue.Queue[Any]] = {}
+        # Keep track of the key and number of uses for every driver handed out by the pool
+        self._info: dict[int, list[Any]] = {}
+        # Temporary increases of `size` made through `reserve()`
+        self._reserved: list[int] = []
+
+    def acquire(
+        self, web_driver: WebDrivers, window_size: tuple[int, int], scale: float = 1.0
+    ) -> Any:
+        key = (web_driver, tuple(window_size), scale)
+
+        with self._lock:
+            idle = self._idle.setdefault(key, queue.Queue())
+
+        while True:
+            try:
+                driver = idle.get_nowait()
+            except queue.Empty:
+                break
+
+            # Reset the state left over from a previous capture (including any resizing of the
+            # window); a driver that fails to do so has most likely lost its browser and is replaced
+            try:
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+                driver.set_window_size(*window_size)
+            except Exception:
+                self._quit(driver)
+                continue
+
+            return driver
+
+        driver = _launch_driver(web_driver=web_driver, window_size=window_size, scale=scale)
+
+        with self._lock:
+            self._info[id(driver)] = [key, 0]
+
+        return driver
+
+    def release(self, driver: Any, discard: bool = False) -> None:
+        with self._lock:
+            info = self._info.get(id(driver))
+
+            # Only drivers handed out by this pool can be returned to it
+            if info is not None and not discard:
+                info[1] += 1
+                idle = self._idle[info[0]]
+
+                if info[1] < self.max_uses and idle.qsize() < self._capacity():
+                    idle.put(driver)
+                    return
+
+        self._quit(driver)
+
+    @contextmanager
+    def reserve(self, size: int) -> Generator[None, None, None]:
+        # Keep at least `size` idle drivers per key for the duration of the context, so that a
+        # batch of captures running in `size` threads can reuse their drivers
+        with self._lock:
+            self._reserved.append(size)
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._reserved.remove(size)
+
+            self.trim()
+
+    def trim(self) -> None:
+        # Quit idle drivers that don't fit in the pool anymore
+        with self._lock:
+            idle_queues = list(self._idle.values())
+            capacity = self._capacity()
+
+        for idle in idle_queues:
+            while idle.qsize() > capacity:
+                try:
+                    driver = idle.get_nowait()
+                except queue.Empty:
+                    break
+
+                self._quit(driver)
+
+    def clear(self) -> None:
+        with self._lock:
+            idle_queues = list(self._idle.values())
+
+        for idle in idle_queues:
+            while True:
+                try:
+                    driver = idle.get_nowait()
+                except queue.Empty:
+                    break
+
+                self._quit(driver)
+
+    def _capacity(self) -> int:
+        return max([self.size, *self._reserved])
+
+    def _quit(self, driver: Any) -> None:
+        with self._lock:
+            self._info.pop(id(driver), None)
+
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+_BROWSER_POOL = _BrowserPool()
+
+atexit.register(_BROWSER_POOL.clear)
+
+
+def configure_browser_pool(size: int = 1, max_uses: int = 50) -> None:
+    """
+    Configure reuse of headless browsers across calls to `save()`.
+
+    By default, `save()` launches a new headless browser for every table and closes it once the
+    screenshot has been taken. Launching a browser is slow and, when saving many tables in a loop,
+    it can account for most of the time spent. Configuring a browser pool keeps browsers alive
+    between calls so that they can be reused.
+
+    Parameters
+    ----------
+    size
+        The maximum number of idle browsers to keep for each combination of `web_driver=`,
+        `window_size=`, and `scale=` used in `save()`. By default, this is set to `1`. Use a value
+        of `0` to disable the pool and return to launching a browser for every call.
+    max_uses
+        The number of captures a browser is used for before it is closed and replaced by a new one.
+        By default, this is set to `50`.
+
+    Returns
+    -------
+    None
+        This function does not return anything; it changes the behavior of subsequent `save()`
+        calls.
+
+    Examples
+    --------
+    Keep a single Chrome browser alive while saving several tables to image files.
+
+    ```python
+    import great_tables as gt
+    from great_tables import GT, exibble
+
+    gt.configure_browser_pool(size=1)
+
+    for col in ["num", "currency"]:
+        GT(exibble[[col]]).save(f"{col}.png")
+    ```
+    """
+
+    if size < 0:
+        raise ValueError("The `size=` value must be zero or a positive integer.")
+
+    if max_uses < 1:
+        raise ValueError("The `max_uses=` value must be a positive integer.")
+
+    _BROWSER_POOL.size = size
+    _BROWSER_POOL.max_uses = max_uses
+
+    # Drop browsers that no longer fit in the pool
+    _BROWSER_POOL.trim()
+
+
+_MAX_IMAGE_PIXELS_LOCK = threading.Lock()
+_max_image_pixels_users = 0
+_max_image_pixels_previous: int | None = None
+
+
+@contextmanager
+def _allow_large_images() -> Generator[None, None, None]:
+    # Lift PIL's decompression bomb limit (screenshots of large windows easily exceed it) while
+    # inside the context, then restore the previous limit; since the limit is global, it's only
+    # restored once no other thread is inside the context
+    global _max_image_pixels_users, _max_image_pixels_previous
+
+    from PIL import Image
+
+    with _MAX_IMAGE_PIXELS_LOCK:
+        if _max_image_pixels_users == 0:
+            _max_image_pixels_previous = Image.MAX_IMAGE_PIXELS
+            Image.MAX_IMAGE_PIXELS = None
+
+        _max_image_pixels_users += 1
+
+    try:
+        yield
+    finally:
+        with _MAX_IMAGE_PIXELS_LOCK:
+            _max_image_pixels_users -= 1
+
+            if _max_image_pixels_users == 0:
+                Image.MAX_IMAGE_PIXELS = _max_image_pixels_previous
+
+
+# Window size used for laying out the table before the window is fit to the table
+_DEFAULT_WINDOW_SIZE = (6000, 6000)
+
+# Measure the element (a table) for fitting the window to it and for cropping screenshots to it.
+# The element is centered in a left-aligned container, so the window has to hold the width of the element plus the body margins
+# and container padding on either side (the element re-centers once the window is narrowed), and
+# extend to the bottom of the element. The layout width (which isn't affected by the page's zoom)
+# tells whether the bounding box is in zoomed CSS pixels or not (as in WebKit, where it's divided
+# by the page's zoom). The window's outer size includes any browser UI.
+_MEASURE_ELEMENT_JS = """
+var element = document.getElementsByTagName(arguments[0])[0];
+var container = element.parentElement;
+var rect = element.getBoundingClientRect();
+var px = function (el, prop) { return parseFloat(window.getComputedStyle(el)[prop]) || 0; };
+return {
+    width: rect.width,
+    bottom: rect.bottom,
+    layoutWidth: element.offsetWidth,
+    margins: (
+        px(document.body, "marginLeft") + px(document.body, "marginRight") +
+        px(container, "paddingLeft") + px(container, "paddingRight")
+    ),
+    uiWidth: window.outerWidth - window.innerWidth,
+    uiHeight: window.outerHeight - window.innerHeight,
+    pixelRatio: window.devicePixelRatio
+};
+"""
+
+
+def _get_rect_scale(measures: dict[str, float], zoom: float) -> float:
+    # Get the number of CSS pixels (of the zoomed page, as shown in the window) per unit of the
+    # element's bounding box: this is 1 if the bounding box already has the page's zoom applied
+    # (as in Firefox) or the zoom if it doesn't (as in WebKit); whichever of the two
+    # zoomed layout widths is closer to the bounding box's width is taken
+    layout_width = measures["layoutWidth"]
+
+    if abs(measures["width"] - layout_width * zoom) <= abs(measures["width"] - layout_width):
+        return 1.0
+
+    return zoom
+
+
+def _get_fit_window_size(measures: dict[str, float], zoom: float) -> tuple[int, int]:
+    # Get the window size needed to show the entire element; lengths from computed styles aren't
+    # affected by the page's zoom, so they are scaled here
+    rect_scale = _get_rect_scale(measures, zoom)
+
+    width = math.ceil(measures["width"] * rect_scale + measures["margins"] * zoom)
+    height = math.ceil(measures["bottom"] * rect_scale)
+
+    return int(width + measures["uiWidth"]), int(height + measures["uiHeight"])
+
+
+def _get_scaling_factor(measures: dict[str, float], zoom: float) -> float:
+    # Get the number of screenshot pixels per unit of the element's location and size
+    return measures["pixelRatio"] * _get_rect_scale(measures, zoom)
+
+
+# Maximum length of a base64-encoded data URL for the HTML content, kept under Chrome's 2 MB limit
+_MAX_DATA_URL_LENGTH = 1_900_000
+
+
+def _get_clip(
+    location: dict[str, float], size: dict[str, float], padding: float
+) -> dict[str, float]:
+    # Get the clip rectangle (in CSS pixels) of an element expanded on all sides by `padding`; the
+    # rectangle can't extend past the top-left corner of the page
+    x = max(location["x"] - padding, 0)
+    y = max(location["y"] - padding, 0)
+
+    return {
+        "x": x,
+        "y": y,
+        "width": location["x"] + size["width"] + padding - x,
+        "height": location["y"] + size["height"] + padding - y,
+        "scale": 1,
+    }
+
+
+def _capture_clip_as_png(
+    driver: Any, location: dict[str, float], size: dict[str, float], padding: float
+) -> bytes:
+    # The clip is captured even where it extends beyond the window, and the base64 data in the
+    # response is decoded just once
+    result = driver.execute_cdp_cmd(
+        "Page.captureScreenshot",
+        {
+            "format": "png",
+            "clip": _get_clip(location=location, size=size, padding=padding),
+            "captureBeyondViewport": True,
+        },
+    )
+
+    return base64.b64decode(result["data"])
+
+
+def _get_crop_box(
+    location: dict[str, float], size: dict[str, float], scaling_factor: float, expand: int
+) -> tuple[int, int, int, int]:
+    # Get the (integer) pixel box of an element in a screenshot, expanded on all sides by `expand`
+    # (with both the element's position and the expansion scaled by `scaling_factor`)
+    expansion_amount = int(round(expand * scaling_factor))
+
+    return (
+        int(location["x"] * scaling_factor) - expansion_amount,
+        int(location["y"] * scaling_factor) - expansion_amount,
+        int((location["x"] + size["width"]) * scaling_factor) + expansion_amount,
+        int((location["y"] + size["height"]) * scaling_factor) + expansion_amount,
+    )
+
+
+# Webdrivers for browsers that can print a page to PDF
+_PRINT_WEB_DRIVERS = ("chrome", "edge", "firefox")
+
+# Number of CSS pixels in an inch
+_PX_PER_INCH = 96
+
+# Range of the `scale` parameter accepted by the CDP Page.printToPDF command
+_CDP_PRINT_SCALE_RANGE = (0.1, 2.0)
+
+# Pin the element to the top-left corner of the page, surrounded on all sides by a margin of
+# `arguments[1]` pixels (the table is otherwise centered and offset by the body margins and the
+# container padding); `arguments[2]` optionally zooms the page. This gets the size of the element
+# along with its margin, which is what the printed page has to hold.
+_PIN_ELEMENT_JS = """
+var element = document.getElementsByTagName(arguments[0])[0];
+if (arguments[2] !== null) {
+    document.body.style.zoom = arguments[2];
+}
+document.body.style.margin = "0";
+element.parentElement.style.padding = "0";
+element.style.setProperty("margin", arguments[1] + "px", "important");
+var rect = element.getBoundingClientRect();
+return [rect.width + 2 * rect.left, rect.height + 2 * rect.top];
+"""
+
+
+def _print_to_pdf(
+    driver: Any,
+    web_driver: WebDrivers,
+    selector: str,
+    padding: float,
+    scale: float,
+) -> bytes:
+    # Print the page to a single-page PDF holding just the element (with `padding` pixels around it)
+    # with no page margins. Chromium-based browsers don't zoom the page, so they print at `scale`
+    # (zooming the page for what lies beyond the range of print scales); other browsers already have
+    # the page zoomed by `scale`.
+    if web_driver in _CDP_WEB_DRIVERS:
+        print_scale = min(max(scale, _CDP_PRINT_SCALE_RANGE[0]), _CDP_PRINT_SCALE_RANGE[1])
+        zoom = None if print_scale == scale else f"{scale / print_scale * 100}%"
+    else:
+        print_scale = 1.0
+        zoom = None
+
+    width, height = driver.execute_script(_PIN_ELEMENT_JS, selector, padding, zoom)
+
+    # Round up the page size so that the element's content doesn't get wrapped
+    width_in = math.ceil(width) * print_scale / _PX_PER_INCH
+    height_in = math.ceil(height) * print_scale / _PX_PER_INCH
+
+    if web_driver in _CDP_WEB_DRIVERS:
+        result = driver.execute_cdp_cmd(
+            "Page.printToPDF",
+            {
+                "printBackground": True,
+                "scale": print_scale,
+                "paperWidth": width_in,
+                "paperHeight": height_in,
+                "marginTop": 0,
+                "marginBottom": 0,
+                "marginLeft": 0,
+                "marginRight": 0,
+                "pageRanges": "1",
+            },
+        )
+
+        pdf_base64 = result["data"]
+    else:
+        from selenium.webdriver.common.print_page_options import PrintOptions
+
+        # The WebDriver print command uses centimeters for all dimensions
+        print_options = PrintOptions()
+        print_options.background = True
+        print_options.page_width = width_in * 2.54
+        print_options.page_height = height_in * 2.54
+        print_options.margin_top = 0
+        print_options.margin_bottom = 0
+        print_options.margin_left = 0
+        print_options.margin_right = 0
+        print_options.page_ranges = ["1"]
+
+        pdf_base64 = driver.print_page(print_options)
+
+    return base64.b64decode(pdf_base64)
+
+
+def _is_full_image_box(
+    box: tuple[int, int, int, int], image_size: tuple[int, int], tolerance: int = 1
+) -> bool:
+    # Determine whether a crop box covers (within `tolerance` pixels) the full extent of an image
+    full_box = (0, 0, *image_size)
+
+    return all(abs(x - y) <= tolerance for x, y in zip(box, full_box))
+
 
 def save(
     self: GT,
@@ -59,7 +550,7 @@ def save(
     scale: float = 1.0,
     expand: int = 5,
     web_driver: WebDrivers = "chrome",
-    window_size: tuple[int, int] = (6000, 6000),
+    window_size: tuple[int, int] | None = None,
 ) -> None:
     """
     Save a table as an image file or a PDF document.
@@ -97,14 +588,16 @@ def save(
         the system and choose the appropriate option based on that.
     window_size
         The size of the window to use when taking the screenshot. This is a tuple of two integers,
-        representing the width and height of the window. By default, this is set to `(6000, 6000)`,
-        a large size that should be sufficient for most tables. If the table is larger than this
-        (and this will be obvious once inspecting the image file) you can increase the appropriate
-        values of the tuple. If the table is very small, then a reduction in these these values will
-        result in a speed gain during image capture. Please note that the window size is *not* the
-        same as the final image size. The table will be captured at the same size as it is displayed
-        in the headless browser, and the window size is used to ensure that the entire table is
-        visible in the screen capture before the cropping process occurs.
+        representing the width and height of the window. By default, this is `None`, and the table
+        is rendered in a large `(6000, 6000)` window; with browsers that take a screenshot of the
+        entire window (Firefox and Safari), the window is then shrunk to fit the table (along with
+        the `expand=` margin) before taking the screenshot. Providing a tuple here uses that window
+        size as is. If the table is larger than the window (and this will be obvious once
+        inspecting the image file) you can increase the appropriate values of the tuple. Please note
+        that the window size is *not* the same as the final image size. The table will be captured
+        at the same size as it is displayed in the headless browser, and the window size is used to
+        ensure that the entire table is visible in the screen capture before the cropping process
+        occurs.
 
     Returns
     -------
@@ -131,18 +624,28 @@ def save(
     pip install great_tables[extra]
     ```
 
+    When saving to a PDF document, the table is printed to PDF by the browser (producing a vector
+    PDF document with selectable text) for all browsers except Safari, whose screenshot is saved as
+    a raster PDF document instead.
+
+    With the Chromium-based browsers (`"chrome"` and `"edge"`), the page is rendered at a device
+    scale factor of `scale=` and the browser itself is asked to capture only the region of the table
+    element, so no cropping of a full-window screenshot is needed. With other browsers, the page is
+    zoomed by `scale=` instead.
+
+    A new headless browser is launched (and then closed) for every call of `save()`. When saving
+    many tables, use `configure_browser_pool()` to keep browsers alive and reuse them instead, or
+    save the tables concurrently with `save_all()`.
+
     """
 
     # Import the required packages
     _try_import(name="selenium", pip_install_line="pip install selenium")
     _try_import(name="PIL", pip_install_line="pip install pillow")
 
-    from selenium import webdriver
+    from selenium.common.exceptions import WebDriverException
     from selenium.webdriver.common.by import By
     from PIL import Image
-    from io import BytesIO
-
-    Image.MAX_IMAGE_PIXELS = None
 
     # Get the file extension from the file name
     file_extension = file.split(".")[-1]
@@ -150,57 +653,67 @@ def save(
     # If there is no file extension, add the .png extension
     if len(file_extension) == len(file):
         file += ".png"
+        file_extension = "png"
+
+    is_png = file_extension.lower() == "png"
+    is_pdf = file_extension.lower() == "pdf"
 
     # Get the HTML content from the displayed output
     html_content = as_raw_html(self)
 
-    # Create a temp directory to store the HTML file
-    temp_dir = tempfile.mkdtemp()
-
-    # Set the webdriver and options based on the chosen browser (`web_driver=` argument)
-    if web_driver == "chrome":
-        wdriver = webdriver.Chrome
-        wd_options = webdriver.ChromeOptions()
-    elif web_driver == "safari":
-        wdriver = webdriver.Safari
-        wd_options = webdriver.SafariOptions()
-    elif web_driver == "firefox":
-        wdriver = webdriver.Firefox
-        wd_options = webdriver.FirefoxOptions()
-    elif web_driver == "edge":
-        wdriver = webdriver.Edge
-        wd_options = webdriver.EdgeOptions()
-
-    # All webdrivers except for 'Firefox' can operate in headless mode; they all accept window size
-    # options are separate width and height arguments
-    if web_driver != "firefox":
-        wd_options.add_argument(str("--headless"))
-
-    wd_options.add_argument(f"--width={window_size[0]}")
-    wd_options.add_argument(f"--height={window_size[1]}")
-
-    with (
-        tempfile.NamedTemporaryFile(suffix=".html", dir=temp_dir) as temp_file,
-        wdriver(options=wd_options) as headless_browser,
-    ):
-
-        # Write the HTML content to the temp file
-        with open(temp_file.name, "w") as fp:
-            fp.write(html_content)
-
-        # Convert the scale value to a percentage string used by the
-        # Chrome browser for zooming
-        zoom_level = str(scale * 100) + "%"
-
-        # Get the scaling factor by multiplying `scale` by 2
-        scaling_factor = scale * 2
-
-        # Adjust the expand value by the scaling factor
-        expansion_amount = expand * scaling_factor
+    # The table is laid out in a large window whenever the window will be fit to the table
+    launch_window_size = _DEFAULT_WINDOW_SIZE if window_size is None else window_size
 
-        # Open the HTML file in the headless browser
-        headless_browser.get("file://" + temp_file.name)
-        headless_browser.execute_script(f"document.body.style.zoom = '{zoom_level}'")
+    headless_browser = _BROWSER_POOL.acquire(
+        web_driver=web_driver, window_size=launch_window_size, scale=scale
+    )
+    discard_browser = False
+
+    html_bytes = html_content.encode("utf-8")
+    encoded_html = base64.b64encode(html_bytes).decode("ascii")
+
+    # A temp directory is only needed for HTML that's too large for a data URL
+    temp_dir = None
+
+    # The browser's output is either a PDF document or a PNG screenshot; a crop box is set when the
+    # screenshot still has to be cropped to the table element, which takes the number of screenshot
+    # pixels per unit of the table's location and size
+    output = b""
+    output_is_pdf = False
+    crop_box: tuple[int, int, int, int] | None = None
+    scaling_factor = 1.0
+
+    try:
+        if len(encoded_html) < _MAX_DATA_URL_LENGTH:
+            # Open the HTML content directly in the headless browser as a data URL
+            headless_browser.get(f"data:text/html;charset=utf-8;base64,{encoded_html}")
+        else:
+            # Write the HTML content to a file in a temp directory; the already encoded content is
+            # written in binary mode, skipping the text layer (and its newline translation)
+            temp_dir = tempfile.mkdtemp()
+            html_path = Path(temp_dir) / "table.html"
+
+            with open(html_path, "wb", buffering=1 << 20) as fp:
+                fp.write(html_bytes)
+
+            # Open the HTML file in the headless browser
+            headless_browser.get(html_path.as_uri())
+
+        if web_driver not in _CDP_WEB_DRIVERS:
+            # Convert the scale value to a percentage string used by the browser for zooming
+            zoom_level = str(scale * 100) + "%"
+            headless_browser.execute_script(f"document.body.style.zoom = '{zoom_level}'")
+
+            # Measure the table for cropping the screenshot later; whether zooming the page scaled
+            # the table's location and size depends on the browser, so this is measured as well
+            measures = headless_browser.execute_script(_MEASURE_ELEMENT_JS, selector)
+            scaling_factor = _get_scaling_factor(measures, zoom=scale)
+
+            if window_size is None:
+                # Shrink the window to fit the rendered table so that the screenshot is no larger
+                # than it needs to be (clipped screenshots don't depend on the window size)
+                fit_width, fit_height = _get_fit_window_size(measures, zoom=scale)
+                headless_browser.set_window_size(fit_width + expand * 2, fit_height + expand * 2)
 
         # Get only the chosen element from the page; by default, this is the table element
         element = headless_browser.find_element(by=By.TAG_NAME, value=selector)
@@ -210,22 +723,156 @@ def save(
         location = element.location
         size = element.size
 
-        # Get a screenshot of the entire page as a PNG image
-        png = headless_browser.get_screenshot_as_png()
+        if is_pdf and web_driver in _PRINT_WEB_DRIVERS:
+            # Have the browser print the page to a (vector) PDF; this needs no screenshot at all
+            output = _print_to_pdf(
+                headless_browser,
+                web_driver=web_driver,
+                selector=selector,
+                padding=expand,
+                scale=scale,
+            )
+            output_is_pdf = True
+        elif web_driver in _CDP_WEB_DRIVERS:
+            # Let the browser capture only the region of the table element (plus the
+            # expansion) rather than the entire window
+            output = _capture_clip_as_png(
+                headless_browser, location=location, size=size, padding=expand
+            )
+        else:
+            # Get a screenshot of the entire page as a PNG image, which is to be cropped to only
+            # include the table element
+            output = headless_browser.get_screenshot_as_png()
+            crop_box = _get_crop_box(
+                location=location, size=size, scaling_factor=scaling_factor, expand=expand
+            )
+
+    except WebDriverException:
+        # A browser that errored out may be in a bad state, so don't hand it out again
+        discard_browser = True
+        raise
+
+    finally:
+        _BROWSER_POOL.release(headless_browser, discard=discard_browser)
+
+        # Remove the temp directory along with the HTML file
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    # A PDF document printed by the browser is already complete
+    if output_is_pdf:
+        Path(file).write_bytes(output)
+        return
+
+    # A screenshot needing no crop (a CDP clip) already contains only the table element, so when
+    # saving to PNG it can be written out as is, without PIL decoding and re-encoding it
+    if crop_box is None and is_png:
+        Path(file).write_bytes(output)
+        return
+
+    # Open the screenshot as an image with the PIL library; since the screenshot may be large
+    # (due to the large window size), we use the BytesIO class to handle the large image data.
+    # PIL checks the image size against its decompression bomb limit both when opening and when
+    # cropping an image, so the limit is lifted for all of the image handling
+    with _allow_large_images():
+        image = Image.open(fp=BytesIO(output))
+
+        # Cropping always allocates a new image, which is wasted effort when the crop box covers
+        # the whole screenshot; a PNG screenshot is then written out as is as well (only the PNG
+        # header has been read so far)
+        if crop_box is not None and _is_full_image_box(crop_box, image.size):
+            if is_png:
+                Path(file).write_bytes(output)
+                return
+
+            crop_box = None
+
+        if crop_box is not None:
+            image = image.crop(crop_box)
+
+        # Save the image to the output path in the specified format
+        image.save(fp=file)
+
+
+def save_all(
+    gts: Sequence[GT],
+    files: Sequence[str],
+    workers: int = 4,
+    selector: str = "table",
+    scale: float = 1.0,
+    expand: int = 5,
+    web_driver: WebDrivers = "chrome",
+    window_size: tuple[int, int] | None = None,
+) -> None:
+    """
+    Save several tables as image files or PDF documents.
 
-    # Open the screenshot as an image with the PIL library; since the screenshot will be large
-    # (due to the large window size), we use the BytesIO class to handle the large image data
-    image = Image.open(fp=BytesIO(png))
+    The `save_all()` function saves each table in `gts` to the corresponding file in `files`, much
+    like calling `GT.save()` on every table. The tables are saved concurrently by up to `workers`
+    headless browsers, which are kept alive (and reused) until all of the tables are saved.
 
-    # Crop the image to only include the table element; the scaling factor
-    # of 6 is used to account for the zoom level of 300% set earlier
-    left = (location["x"] * scaling_factor) - expansion_amount
-    top = (location["y"] * scaling_factor) - expansion_amount
-    right = ((location["x"] + size["width"]) * scaling_factor) + expansion_amount
-    bottom = ((location["y"] + size["height"]) * scaling_factor) + expansion_amount
+    Parameters
+    ----------
+    gts
+        A sequence of GT objects.
+    files
+        The names of the files to save the tables to, one for each GT object in `gts`. See the
+        `file=` argument of `GT.save()` for the file types that are accepted.
+    workers
+        The maximum number of tables to save at the same time (each requiring a headless browser).
+        By default, this is set to `4`. Note that Safari only allows a single automated session, so
+        `workers=1` should be used with `web_driver="safari"`.
+    selector, scale, expand, web_driver, window_size
+        Options for saving each table. See `GT.save()` for details.
 
-    # Save the cropped image to the output path
-    image = image.crop((left, top, right, bottom))
+    Returns
+    -------
+    None
+        This function does not return anything; it simply saves the tables to the specified file
+        paths.
+
+    Examples
+    --------
+    Save a table for each of the row groups in the `exibble` dataset.
+
+    ```python
+    from great_tables import GT, exibble, save_all
+
+    groups = exibble["group"].unique()
+
+    save_all(
+        [GT(exibble[exibble["group"] == group]) for group in groups],
+        [f"{group}.png" for group in groups],
+        workers=2,
+    )
+    ```
+    """
 
-    # Save the image to the output path in the specified format
-    image.save(fp=file)
+    if len(gts) != len(files):
+        raise ValueError(
+            f"The number of GT objects ({len(gts)}) must match the number of files ({len(files)})."
+        )
+
+    if workers < 1:
+        raise ValueError("The `workers=` value must be a positive integer.")
+
+    # Selenium commands are blocking HTTP requests, so threads are sufficient for running captures
+    # concurrently; while saving, the browser pool keeps one driver per worker for reuse
+    with _BROWSER_POOL.reserve(workers), ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                save,
+                gt,
+                file=file,
+                selector=selector,
+                scale=scale,
+                expand=expand,
+                web_driver=web_driver,
+                window_size=window_size,
+            )
+            for gt, file in zip(gts, files)
+        ]
+
+        # Raise the first error encountered (if any)
+        for future in futures:
+            future.result()
@@ -31,6 +31,9 @@ T = TypeVar("T")
 # GT Data ----
 __GT = None
 
+# Attributes that GT objects use to cache their built tables and rendered HTML
+_CACHE_ATTRS = ("_build_cache", "_html_cache")
+
 
 @dataclass(frozen=True)
 class GTData:
@@ -55,6 +58,10 @@ class GTData:
     def _replace(self, **kwargs: Any) -> Self:
         new_obj = copy.copy(self)
 
+        # Rendered output cached on this object doesn't apply to the modified copy
+        for cache_attr in _CACHE_ATTRS:
+            new_obj.__dict__.pop(cache_attr, None)
+
         missing = {k for k in kwargs if k not in new_obj.__dict__}
         if missing:
             raise ValueError(f"Replacements not in data: {missing}")
@@ -73,7 +80,9 @@ class GTData:
         id: str | None = None,
         locale: str | None = None,
     ):
-        data = validate_frame(data)
+        # The data is copied so that later in-place changes to the caller's DataFrame can't leak
+        # into this (otherwise unchanging) table or the renders cached from it
+        data = copy_data(validate_frame(data))
         stub = Stub(data, rowname_col=rowname_col, groupname_col=groupname_col)
         boxhead = Boxhead(
             data, auto_align=auto_align, rowname_col=rowname_col, groupname_col=groupname_col
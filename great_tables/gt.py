@@ -283,6 +283,17 @@ class GT(
         return self._replace(_body=new_body)
 
     def _build_data(self, context: str) -> Self:
+        # The built table only depends on this (unchanging) GT object and the context, so it's kept
+        # for reuse by later renders; `_replace()` drops it from modified copies, and the table data
+        # is a copy of the caller's DataFrame (see `GTData.from_data()`)
+        build_cache = self.__dict__.setdefault("_build_cache", {})
+
+        if context not in build_cache:
+            build_cache[context] = self._build_data_uncached(context)
+
+        return build_cache[context]
+
+    def _build_data_uncached(self, context: str) -> Self:
         # Build the body of the table by generating a dictionary
         # of lists with cells initially set to nan values
         built = self._render_formats(context)
@@ -1,8 +1,23 @@
+import base64
 import time
+import warnings
+from io import BytesIO
 from pathlib import Path
 
+import pandas as pd
 import pytest
-from great_tables import GT, exibble, md
+from great_tables import GT, configure_browser_pool, exibble, md, save_all
+from great_tables import _export
+from great_tables._export import (
+    _BrowserPool,
+    _allow_large_images,
+    _get_clip,
+    _get_crop_box,
+    _get_fit_window_size,
+    _get_scaling_factor,
+    _is_full_image_box,
+    _print_to_pdf,
+)
 
 
 @pytest.fixture
@@ -46,3 +61,563 @@ def test_save_image_file(gt_tbl: GT):
     assert Path("test_image.png").exists()
 
     Path("test_image.png").unlink()
+
+
+def _make_png(width: int, height: int) -> bytes:
+    from PIL import Image, PngImagePlugin
+
+    # The text chunk marks the PNG as coming from the browser (PIL drops it when re-encoding)
+    png_info = PngImagePlugin.PngInfo()
+    png_info.add_text("Source", "browser")
+
+    buf = BytesIO()
+    Image.new("RGB", (int(width), int(height)), "white").save(buf, format="PNG", pnginfo=png_info)
+
+    return buf.getvalue()
+
+
+class FakeElement:
+    def __init__(self, location: dict[str, float], size: dict[str, float]):
+        self.location = location
+        self.size = size
+
+
+class FakeDriver:
+    def __init__(self, fail_reset: bool = False):
+        self.fail_reset = fail_reset
+        self.urls = []
+        self.html_files = []
+        self.cdp_cmds = []
+        self.window_size = None
+        self.quit_called = False
+
+        # The rendered table and its measurements reported by the browser
+        self.element = FakeElement(location={"x": 8, "y": 8}, size={"width": 200, "height": 100})
+        self.measures = {
+            "width": 200,
+            "bottom": 108,
+            "layoutWidth": 200,
+            "margins": 16,
+            "uiWidth": 0,
+            "uiHeight": 0,
+            "pixelRatio": 1,
+        }
+        self.error = None
+
+    def delete_all_cookies(self):
+        if self.fail_reset:
+            raise RuntimeError("browser is gone")
+
+    def get(self, url: str):
+        self.urls.append(url)
+
+        # Record the content of HTML files while they exist
+        if url.startswith("file://"):
+            self.html_files.append(Path(url.removeprefix("file://")).read_text(encoding="utf-8"))
+
+    def set_window_size(self, width: int, height: int):
+        self.window_size = (width, height)
+
+    def execute_script(self, script: str, *args):
+        if script == _export._MEASURE_ELEMENT_JS:
+            return self.measures
+
+        if script == _export._PIN_ELEMENT_JS:
+            padding = args[1]
+            return [
+                self.element.size["width"] + 2 * padding,
+                self.element.size["height"] + 2 * padding,
+            ]
+
+    def find_element(self, by, value):
+        if self.error is not None:
+            raise self.error
+
+        return self.element
+
+    def execute_cdp_cmd(self, cmd: str, params: dict):
+        self.cdp_cmds.append((cmd, params))
+
+        if cmd == "Page.captureScreenshot":
+            self.screenshot = _make_png(params["clip"]["width"], params["clip"]["height"])
+        else:
+            self.screenshot = b"%PDF-1.4"
+
+        return {"data": base64.b64encode(self.screenshot).decode()}
+
+    def get_screenshot_as_png(self):
+        self.screenshot = _make_png(*self.window_size)
+
+        return self.screenshot
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def fake_launch(monkeypatch: pytest.MonkeyPatch):
+    launched = []
+
+    def _launch_driver(web_driver, window_size, scale):
+        driver = FakeDriver()
+        driver.set_window_size(*window_size)
+        launched.append(driver)
+        return driver
+
+    monkeypatch.setattr(_export, "_launch_driver", _launch_driver)
+
+    return launched
+
+
+@pytest.fixture
+def fake_browser(monkeypatch: pytest.MonkeyPatch, fake_launch):
+    pytest.importorskip("selenium")
+    pytest.importorskip("PIL")
+
+    # Use a separate browser pool that doesn't keep any browsers
+    monkeypatch.setattr(_export, "_BROWSER_POOL", _BrowserPool(size=0))
+
+    return fake_launch
+
+
+def test_browser_pool_disabled_quits_driver(fake_launch):
+    pool = _BrowserPool(size=0)
+
+    driver = pool.acquire("chrome", (100, 100))
+    pool.release(driver)
+
+    assert driver.quit_called
+    assert pool.acquire("chrome", (100, 100)) is not driver
+    assert len(fake_launch) == 2
+
+
+def test_browser_pool_reuses_driver(fake_launch):
+    pool = _BrowserPool(size=1)
+
+    driver = pool.acquire("chrome", (100, 100))
+    pool.release(driver)
+
+    assert not driver.quit_called
+    driver.set_window_size(50, 50)
+
+    assert pool.acquire("chrome", (100, 100)) is driver
+    assert driver.urls == ["about:blank"]
+    assert driver.window_size == (100, 100)
+
+    # Drivers aren't shared across different launch settings
+    assert pool.acquire("chrome", (200, 200)) is not driver
+    assert pool.acquire("chrome", (100, 100), scale=2.0) is not driver
+
+
+def test_browser_pool_recycles_driver(fake_launch):
+    pool = _BrowserPool(size=1, max_uses=2)
+
+    driver = pool.acquire("chrome", (100, 100))
+    pool.release(driver)
+    pool.release(pool.acquire("chrome", (100, 100)))
+
+    assert driver.quit_called
+    assert pool.acquire("chrome", (100, 100)) is not driver
+
+
+def test_browser_pool_discards_driver(fake_launch):
+    pool = _BrowserPool(size=1)
+
+    driver = pool.acquire("chrome", (100, 100))
+    pool.release(driver, discard=True)
+
+    assert driver.quit_called
+
+    # Drivers that fail to reset are replaced
+    new_driver = pool.acquire("chrome", (100, 100))
+    pool.release(new_driver)
+    new_driver.fail_reset = True
+
+    assert pool.acquire("chrome", (100, 100)) is not new_driver
+    assert new_driver.quit_called
+
+
+def test_browser_pool_clear(fake_launch):
+    pool = _BrowserPool(size=2)
+
+    drivers = [pool.acquire("chrome", (100, 100)) for _ in range(2)]
+
+    for driver in drivers:
+        pool.release(driver)
+
+    pool.clear()
+
+    assert all(driver.quit_called for driver in drivers)
+
+
+def test_configure_browser_pool_raises():
+    with pytest.raises(ValueError):
+        configure_browser_pool(size=-1)
+
+    with pytest.raises(ValueError):
+        configure_browser_pool(max_uses=0)
+
+
+@pytest.mark.parametrize(
+    "box, expected",
+    [
+        ((0, 0, 200, 100), True),
+        ((0.5, -1, 201, 100), True),
+        ((0, 0, 150, 100), False),
+        ((-5, -5, 205, 105), False),
+    ],
+)
+def test_is_full_image_box(box, expected):
+    assert _is_full_image_box(box, (200, 100)) is expected
+
+
+def test_get_clip():
+    clip = _get_clip(location={"x": 10, "y": 2}, size={"width": 100, "height": 50}, padding=5)
+
+    assert clip == {"x": 5, "y": 0, "width": 110, "height": 57, "scale": 1}
+
+
+def test_as_raw_html_cached(gt_tbl: GT):
+    html = gt_tbl.as_raw_html()
+
+    assert gt_tbl.as_raw_html() is html
+    assert gt_tbl.as_raw_html(make_page=True) is not html
+
+    # Modifying the table produces a new GT object without the cached HTML
+    new_gt_tbl = gt_tbl.tab_source_note(source_note="A second source note.")
+
+    assert "A second source note." in new_gt_tbl.as_raw_html()
+    assert "A second source note." not in gt_tbl.as_raw_html()
+
+
+def test_as_raw_html_cached_data_mutated_in_place():
+    df = pd.DataFrame({"x": [1.0, 2.0], "y": [1.0, 2.0]})
+    gt_tbl = GT(df, id="t")
+
+    html = gt_tbl.as_raw_html()
+
+    # Changing the DataFrame in place doesn't affect the GT object or its cached HTML
+    df.loc[1, "y"] = 555.0
+
+    assert gt_tbl.as_raw_html() is html
+    assert "555" not in html
+
+    # A copy without the cached HTML renders the same table
+    assert gt_tbl._replace().as_raw_html() == html
+
+
+def test_as_raw_html_not_cached_without_id():
+    gt_tbl = GT(exibble[["num"]])
+
+    assert gt_tbl.as_raw_html() != gt_tbl.as_raw_html()
+
+
+def test_browser_pool_reserve(fake_launch):
+    pool = _BrowserPool(size=0)
+
+    with pool.reserve(2):
+        drivers = [pool.acquire("chrome", (100, 100)) for _ in range(2)]
+
+        for driver in drivers:
+            pool.release(driver)
+
+        assert not any(driver.quit_called for driver in drivers)
+
+    assert all(driver.quit_called for driver in drivers)
+
+
+def test_save_all(monkeypatch: pytest.MonkeyPatch, gt_tbl: GT):
+    saved = []
+
+    def save(gt, file, **kwargs):
+        saved.append((gt, file, kwargs["scale"]))
+
+    monkeypatch.setattr(_export, "save", save)
+
+    save_all([gt_tbl, gt_tbl], ["a.png", "b.png"], workers=2, scale=2.0)
+
+    assert sorted(saved, key=lambda x: x[1]) == [(gt_tbl, "a.png", 2.0), (gt_tbl, "b.png", 2.0)]
+
+
+def test_save_all_raises(gt_tbl: GT):
+    with pytest.raises(ValueError):
+        save_all([gt_tbl], ["a.png", "b.png"])
+
+    with pytest.raises(ValueError):
+        save_all([gt_tbl], ["a.png"], workers=0)
+
+
+def test_get_crop_box():
+    box = _get_crop_box(
+        location={"x": 10.5, "y": 2}, size={"width": 100, "height": 50}, scaling_factor=2, expand=5
+    )
+
+    assert box == (11, -6, 231, 114)
+    assert all(isinstance(x, int) for x in box)
+
+
+@pytest.mark.parametrize(
+    "width, bottom, expected",
+    [
+        # Bounding box with the page's zoom applied (as in Firefox)
+        (400, 216, (432, 236)),
+        # Bounding box divided by the page's zoom (as in WebKit)
+        (200, 108, (432, 236)),
+    ],
+)
+def test_get_fit_window_size_zoomed(width: float, bottom: float, expected: tuple[int, int]):
+    measures = {
+        "width": width,
+        "bottom": bottom,
+        "layoutWidth": 200,
+        "margins": 16,
+        "uiWidth": 0,
+        "uiHeight": 20,
+    }
+
+    assert _get_fit_window_size(measures, zoom=2) == expected
+
+
+@pytest.mark.parametrize(
+    "width, expected",
+    [
+        # Bounding box with the page's zoom applied (as in Firefox)
+        (400, 2),
+        # Bounding box divided by the page's zoom (as in WebKit)
+        (200, 4),
+    ],
+)
+def test_get_scaling_factor(width: float, expected: float):
+    measures = {"width": width, "layoutWidth": 200, "pixelRatio": 2}
+
+    assert _get_scaling_factor(measures, zoom=2) == expected
+    assert _get_scaling_factor(measures | {"width": 200}, zoom=1) == 2
+
+
+def test_get_fit_window_size_unzoomed():
+    measures = {
+        "width": 200.5,
+        "bottom": 108.2,
+        "layoutWidth": 200,
+        "margins": 16,
+        "uiWidth": 2,
+        "uiHeight": 20,
+    }
+
+    assert _get_fit_window_size(measures, zoom=1) == (219, 129)
+
+
+def test_allow_large_images():
+    Image = pytest.importorskip("PIL.Image")
+
+    max_image_pixels = Image.MAX_IMAGE_PIXELS
+
+    with _allow_large_images():
+        with _allow_large_images():
+            assert Image.MAX_IMAGE_PIXELS is None
+
+        assert Image.MAX_IMAGE_PIXELS is None
+
+    assert Image.MAX_IMAGE_PIXELS == max_image_pixels
+
+
+class PrintDriver:
+    # The table is centered in a large window, far from the top-left corner of the page; pinning
+    # it there (with `padding` around it) is left to the script run by `_print_to_pdf()`
+    location = {"x": 2916, "y": 16}
+    size = {"width": 176, "height": 86}
+
+    def execute_script(self, script, selector, padding, zoom):
+        self.zoom = zoom
+        return [self.size["width"] + 2 * padding, self.size["height"] + 2 * padding]
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cmd, self.params = cmd, params
+        return {"data": base64.b64encode(b"%PDF-1.4").decode()}
+
+
+@pytest.mark.parametrize(
+    "scale, print_scale, zoom",
+    [(1.0, 1.0, None), (1.5, 1.5, None), (3.0, 2.0, "150.0%")],
+)
+def test_print_to_pdf_cdp(scale, print_scale, zoom):
+    driver = PrintDriver()
+
+    pdf = _print_to_pdf(driver, web_driver="chrome", selector="table", padding=5, scale=scale)
+
+    assert pdf == b"%PDF-1.4"
+    assert driver.cmd == "Page.printToPDF"
+    assert driver.zoom == zoom
+    assert driver.params["scale"] == print_scale
+
+    # The paper holds the table plus the padding on both sides, regardless of its location
+    assert driver.params["paperWidth"] == pytest.approx(186 * print_scale / 96)
+    assert driver.params["paperHeight"] == pytest.approx(96 * print_scale / 96)
+
+
+@pytest.mark.extra
+def test_save_png_clip_passthrough(
+    monkeypatch: pytest.MonkeyPatch, fake_browser, gt_tbl: GT, tmp_path: Path
+):
+    from PIL import Image
+
+    # The clip isn't even opened with PIL
+    def fail_open(*args, **kwargs):
+        raise AssertionError("PIL opened the screenshot")
+
+    monkeypatch.setattr(Image, "open", fail_open)
+
+    gt_tbl.save(file=str(tmp_path / "table"))
+
+    (driver,) = fake_browser
+
+    # The HTML is loaded from a data URL and the clip is saved as is (with a .png extension added)
+    assert driver.urls == [
+        "data:text/html;charset=utf-8;base64,"
+        + base64.b64encode(gt_tbl.as_raw_html().encode("utf-8")).decode("ascii")
+    ]
+    assert driver.cdp_cmds[0][1]["clip"] == {
+        "x": 3,
+        "y": 3,
+        "width": 210,
+        "height": 110,
+        "scale": 1,
+    }
+    assert (tmp_path / "table.png").read_bytes() == driver.screenshot
+    assert driver.quit_called
+
+
+@pytest.mark.extra
+def test_save_clip_other_format(fake_browser, gt_tbl: GT, tmp_path: Path):
+    from PIL import Image
+
+    gt_tbl.save(file=str(tmp_path / "table.bmp"), web_driver="edge")
+
+    with Image.open(tmp_path / "table.bmp") as image:
+        assert image.format == "BMP"
+        assert image.size == (210, 110)
+
+
+@pytest.mark.extra
+def test_save_large_html_uses_temp_file(
+    monkeypatch: pytest.MonkeyPatch, fake_browser, gt_tbl: GT, tmp_path: Path
+):
+    monkeypatch.setattr(_export, "_MAX_DATA_URL_LENGTH", 0)
+
+    gt_tbl.save(file=str(tmp_path / "table.png"))
+
+    (driver,) = fake_browser
+
+    # The HTML file existed while the browser loaded it, and was removed afterwards
+    assert driver.urls[0].startswith("file://")
+    assert driver.html_files == [gt_tbl.as_raw_html()]
+    assert not Path(driver.urls[0].removeprefix("file://")).parent.exists()
+
+
+@pytest.mark.extra
+def test_save_fit_window_and_crop(
+    monkeypatch: pytest.MonkeyPatch, fake_browser, gt_tbl: GT, tmp_path: Path
+):
+    from PIL import Image
+
+    # Crops exceeding PIL's decompression bomb limit are allowed (as are the screenshots)
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 1000)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        gt_tbl.save(file=str(tmp_path / "table.png"), web_driver="firefox")
+
+    (driver,) = fake_browser
+
+    # The window was fit to the table (plus the expansion) before the screenshot was cropped
+    assert driver.window_size == (226, 118)
+
+    assert Image.MAX_IMAGE_PIXELS == 1000
+
+    with _allow_large_images(), Image.open(tmp_path / "table.png") as image:
+        assert image.size == (210, 110)
+
+
+@pytest.mark.extra
+def test_save_full_screenshot_passthrough(
+    monkeypatch: pytest.MonkeyPatch, fake_browser, gt_tbl: GT, tmp_path: Path
+):
+    driver = FakeDriver()
+    driver.element = FakeElement(location={"x": 5, "y": 5}, size={"width": 200, "height": 100})
+    driver.set_window_size(210, 110)
+
+    monkeypatch.setattr(_export, "_launch_driver", lambda web_driver, window_size, scale: driver)
+
+    gt_tbl.save(file=str(tmp_path / "table.png"), web_driver="safari", window_size=(210, 110))
+
+    # The crop box covers the whole screenshot, so it's saved without cropping or re-encoding
+    assert driver.window_size == (210, 110)
+    assert (tmp_path / "table.png").read_bytes() == driver.screenshot
+
+
+@pytest.mark.extra
+def test_save_zoomed_webkit_crop(
+    monkeypatch: pytest.MonkeyPatch, fake_browser, gt_tbl: GT, tmp_path: Path
+):
+    from PIL import Image
+
+    driver = FakeDriver()
+    driver.set_window_size(1000, 600)
+
+    # WebKit reports the bounding box (and so the element's location and size) unzoomed
+    driver.measures["pixelRatio"] = 2
+
+    monkeypatch.setattr(_export, "_launch_driver", lambda web_driver, window_size, scale: driver)
+
+    gt_tbl.save(
+        file=str(tmp_path / "table.png"), web_driver="safari", scale=2, window_size=(1000, 600)
+    )
+
+    # The crop is scaled by both the page's zoom and the device pixel ratio
+    with Image.open(tmp_path / "table.png") as image:
+        assert image.size == (840, 440)
+
+
+@pytest.mark.extra
+def test_save_pdf_printed(
+    monkeypatch: pytest.MonkeyPatch, fake_browser, gt_tbl: GT, tmp_path: Path
+):
+    driver = FakeDriver()
+    driver.element = FakeElement(location={"x": 2916, "y": 16}, size={"width": 176, "height": 86})
+
+    monkeypatch.setattr(_export, "_launch_driver", lambda web_driver, window_size, scale: driver)
+
+    gt_tbl.save(file=str(tmp_path / "table.pdf"))
+
+    # The centered table is pinned to the page corner, so the paper only holds the table and the
+    # expansion on either side
+    ((cmd, params),) = driver.cdp_cmds
+
+    assert cmd == "Page.printToPDF"
+    assert params["paperWidth"] == pytest.approx(186 / 96)
+    assert params["paperHeight"] == pytest.approx(96 / 96)
+    assert (tmp_path / "table.pdf").read_bytes() == b"%PDF-1.4"
+
+
+@pytest.mark.extra
+def test_save_discards_driver_on_error(
+    monkeypatch: pytest.MonkeyPatch, fake_browser, gt_tbl: GT, tmp_path: Path
+):
+    from selenium.common.exceptions import WebDriverException
+
+    monkeypatch.setattr(_export, "_BROWSER_POOL", _BrowserPool(size=1))
+
+    gt_tbl.save(file=str(tmp_path / "table.png"))
+
+    (driver,) = fake_browser
+
+    # A successful save keeps the browser in the pool, but one that errors out is discarded
+    assert not driver.quit_called
+
+    driver.error = WebDriverException("no such element")
+
+    with pytest.raises(WebDriverException):
+        gt_tbl.save(file=str(tmp_path / "table.png"))
+
+    assert driver.quit_called
+    assert len(fake_browser) == 1
@@ -2,7 +2,6 @@ import pandas as pd
 import pytest
 from great_tables import GT
 
-
 # Generate a gt Table object for assertion testing
 data = [{"a": 5, "b": 15}, {"a": 15, "b": 2000}]
 pd_data = pd.DataFrame(data)
@@ -59,3 +58,31 @@ def test_gt_table_render(gt_tbl: GT):
         ).__name__
         == "str"
     )
+
+
+def test_gt_build_data_cached(gt_tbl: GT):
+    built = gt_tbl._build_data(context="html")
+
+    assert gt_tbl._build_data(context="html") is built
+    assert gt_tbl.tab_header(title="Title")._build_data(context="html") is not built
+
+    # Rendering a cached build still gets a new random table ID each time
+    assert gt_tbl.as_raw_html() != gt_tbl.as_raw_html()
+
+
+def test_gt_build_data_cached_data_mutated_in_place():
+    df = pd.DataFrame({"x": [1.0, 2.0], "y": [1.0, 2.0]})
+    gt_tbl = GT(df).fmt_number(columns="x")
+
+    built = gt_tbl._build_data(context="html")
+
+    # Changing the DataFrame in place doesn't affect the GT object
+    df.loc[0, "x"] = 777.0
+    df.loc[0, "y"] = 888.0
+
+    assert gt_tbl._tbl_data is not df
+    assert gt_tbl._build_data(context="html") is built
+
+    html = GT(df).fmt_number(columns="x").as_raw_html()
+    assert "777.00" in html and "888" in html
+    assert "777" not in gt_tbl.as_raw_html() and "888" not in gt_tbl.as_raw_html()